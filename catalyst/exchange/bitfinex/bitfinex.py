@@ -46,8 +46,6 @@ class Bitfinex(Exchange):
         self.secret = secret.encode('UTF-8')
         self.name = 'bitfinex'
         self.color = 'green'
-        self.assets = {}
-        self.load_assets()
         self.base_currency = base_currency
         self._portfolio = portfolio
         self.minute_writer = None
@@ -59,7 +57,6 @@ class Bitfinex(Exchange):
         # Max is 90 but playing it safe
         # https://www.bitfinex.com/posts/188
         self.max_requests_per_minute = 80
-        self.request_cpt = dict()
 
         self.bundle = ExchangeBundle(self)
 
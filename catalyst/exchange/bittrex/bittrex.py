@@ -1,9 +1,16 @@
+import hashlib
 import json
+import os
+import time
+from concurrent import futures
 
+import numpy as np
 import pandas as pd
+import requests
 from catalyst.assets._assets import TradingPair
 from logbook import Logger
-from six.moves import urllib
+from requests.adapters import HTTPAdapter
+from requests.packages.urllib3.util.retry import Retry
 
 from catalyst.exchange.bittrex.bittrex_api import Bittrex_api
 from catalyst.exchange.exchange import Exchange
@@ -14,7 +21,7 @@ from catalyst.exchange.exchange_errors import InvalidHistoryFrequencyError, \
 from catalyst.finance.execution import LimitOrder, StopLimitOrder
 from catalyst.finance.order import Order, ORDER_STATUS
 from catalyst.exchange.exchange_utils import get_exchange_symbols_filename, \
-    download_exchange_symbols
+    download_exchange_symbols, fast_json_loads
 
 from catalyst.constants import LOG_LEVEL
 
@@ -22,28 +29,54 @@ log = Logger('Bittrex', level=LOG_LEVEL)
 
 URL2 = 'https://bittrex.com/Api/v2.0'
 
+FREQUENCY_MAP = {
+    'minute': 'oneMin',
+    '1m': 'oneMin',
+    '5m': 'fiveMin',
+    '30m': 'thirtyMin',
+    '1h': 'hour',
+    'daily': 'day',
+    '1D': 'day',
+}
+
+ORDER_TYPE_MAP = {
+    'all': 'both',
+    'bid': 'buy',
+    'ask': 'sell',
+}
+
 
 class Bittrex(Exchange):
-    def __init__(self, key, secret, base_currency, portfolio=None):
+    def __init__(self, key, secret, base_currency, portfolio=None,
+                 pool_connections=4, pool_maxsize=32,
+                 max_concurrent_requests=10):
         self.api = Bittrex_api(key=key, secret=secret.encode('UTF-8'))
         self.name = 'bittrex'
         self.color = 'blue'
         self.base_currency = base_currency
         self._portfolio = portfolio
 
+        # Re-using a single session keeps the https sockets alive between
+        # requests instead of paying a new TLS handshake for every asset.
+        self._http = requests.Session()
+        self._http.mount('https://', HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=Retry(total=3, backoff_factor=0.2)
+        ))
+
+        # Bounds the fan-out when fetching multiple assets concurrently.
+        self._max_concurrent_requests = max_concurrent_requests
+
         self.num_candles_limit = 2000
 
         # Not sure what the rate limit is but trying to play it safe
         # https://bitcoin.stackexchange.com/questions/53778/bittrex-api-rate-limit
         self.max_requests_per_minute = 60
-        self.request_cpt = dict()
 
         self.minute_writer = None
         self.minute_reader = None
 
-        self.assets = dict()
-        self.load_assets()
-
         self.bundle = ExchangeBundle(self)
 
     @property
@@ -142,13 +175,19 @@ class Bittrex(Exchange):
             raise ExchangeRequestError(error=e)
 
         orders = list()
-        for order_status in open_orders:
-            order = self._create_order(order_status)
-            orders.append(order)
+        if open_orders:
+            # One vectorized parse instead of a to_datetime call per order.
+            dates = pd.to_datetime(
+                [order_status['Opened'] for order_status in open_orders],
+                utc=True
+            )
+            for order_status, date in zip(open_orders, dates):
+                order = self._create_order(order_status, date=date)
+                orders.append(order)
 
         return orders
 
-    def _create_order(self, order_status):
+    def _create_order(self, order_status, date=None):
         log.info(
             'creating catalyst order from Bittrex {}'.format(order_status))
         if order_status['CancelInitiated']:
@@ -158,7 +197,8 @@ class Bittrex(Exchange):
         else:
             status = ORDER_STATUS.OPEN
 
-        date = pd.to_datetime(order_status['Opened'], utc=True)
+        if date is None:
+            date = pd.to_datetime(order_status['Opened'], utc=True)
         amount = order_status['Quantity']
         filled = amount - order_status['QuantityRemaining']
         order = Order(
@@ -222,25 +262,16 @@ class Bittrex(Exchange):
         """
         log.info('retrieving candles')
 
-        if data_frequency == 'minute' or data_frequency == '1m':
-            frequency = 'oneMin'
-        elif data_frequency == '5m':
-            frequency = 'fiveMin'
-        elif data_frequency == '30m':
-            frequency = 'thirtyMin'
-        elif data_frequency == '1h':
-            frequency = 'hour'
-        elif data_frequency == 'daily' or data_frequency == '1D':
-            frequency = 'day'
-        else:
+        frequency = FREQUENCY_MAP.get(data_frequency)
+        if frequency is None:
             raise InvalidHistoryFrequencyError(
                 frequency=data_frequency
             )
 
         # Making sure that assets are iterable
         asset_list = [assets] if isinstance(assets, TradingPair) else assets
-        ohlc_map = dict()
-        for asset in asset_list:
+
+        def fetch_candles(asset):
             url = '{url}/pub/market/GetTicks?marketName={symbol}' \
                   '&tickInterval={frequency}&_=1499127220008'.format(
                 url=URL2,
@@ -249,7 +280,10 @@ class Bittrex(Exchange):
             )
 
             try:
-                data = json.loads(urllib.request.urlopen(url).read().decode())
+                response = self._http.get(url, timeout=10)
+                # Parsing the raw bytes directly skips a decode copy and
+                # uses orjson/ujson when available.
+                data = fast_json_loads(response.content)
             except Exception as e:
                 raise ExchangeRequestError(error=e)
 
@@ -258,10 +292,40 @@ class Bittrex(Exchange):
                     error='Unable to fetch candles {}'.format(data['message'])
                 )
 
-            candles = data['result']
+            return data['result']
 
-            def ohlc_from_candle(candle):
-                ohlc = dict(
+        # Dispatching the requests concurrently, one round-trip per asset
+        # serially would cost one full rtt per symbol.
+        if len(asset_list) == 1:
+            candle_map = {asset_list[0]: fetch_candles(asset_list[0])}
+        else:
+            workers = min(len(asset_list), self._max_concurrent_requests)
+            with futures.ThreadPoolExecutor(max_workers=workers) as pool:
+                candle_map = dict(
+                    zip(asset_list, pool.map(fetch_candles, asset_list))
+                )
+
+        ohlc_map = dict()
+        for asset in asset_list:
+            candles = candle_map[asset]
+
+            # New or illiquid markets can legitimately return no ticks
+            # for a windowed request; the single-bar path has no value
+            # of the right shape to return.
+            if not candles:
+                if bar_count is None:
+                    raise ExchangeRequestError(
+                        error='no candles available for {}'.format(
+                            self.get_symbol(asset)
+                        )
+                    )
+
+                ohlc_map[asset] = []
+                continue
+
+            if bar_count is None:
+                candle = candles[-1]
+                ohlc_map[asset] = dict(
                     open=candle['O'],
                     high=candle['H'],
                     low=candle['L'],
@@ -270,47 +334,63 @@ class Bittrex(Exchange):
                     price=candle['C'],
                     last_traded=pd.to_datetime(candle['T'], utc=True)
                 )
-                return ohlc
-
-            ordered_candles = list(reversed(candles))
-            if bar_count is None:
-                ohlc_map[asset] = ohlc_from_candle(ordered_candles[0])
             else:
-                ohlc_bars = []
-                for candle in ordered_candles[:bar_count]:
-                    ohlc = ohlc_from_candle(candle)
-                    ohlc_bars.append(ohlc)
+                # Building the bars in one batch, a single vectorized
+                # to_datetime replaces one Python-level parse per candle.
+                df = pd.DataFrame(candles[-bar_count:][::-1])
+                last_traded = pd.to_datetime(df['T'], utc=True)
 
-                ohlc_map[asset] = ohlc_bars
+                df = df.rename(columns={'O': 'open', 'H': 'high', 'L': 'low',
+                                        'C': 'close', 'V': 'volume'})
+                df = df[['open', 'high', 'low', 'close', 'volume']]
+                df['price'] = df['close']
+                df['last_traded'] = last_traded
+
+                ohlc_map[asset] = df.to_dict('records')
 
         return ohlc_map[assets] \
             if isinstance(assets, TradingPair) else ohlc_map
 
     def tickers(self, assets):
         """
-        As of v1.1, Bittrex only allows one ticker at the time.
-        So we have to make multiple calls to fetch multiple assets.
+        The public getmarketsummaries endpoint returns every ticker in
+        one response, so a single call covers any number of assets.
 
         :param assets:
         :return:
         """
         log.info('retrieving tickers')
 
+        try:
+            self.ask_request()
+            summaries = self.api.getmarketsummaries()
+        except Exception as e:
+            raise ExchangeRequestError(error=e)
+
+        try:
+            by_symbol = dict(
+                (summary['MarketName'], summary) for summary in summaries
+            )
+        except TypeError:
+            raise ExchangeRequestError(error=summaries)
+
+        timestamp = pd.Timestamp.utcnow()
+
         ticks = dict()
         for asset in assets:
             symbol = self.get_symbol(asset)
             try:
-                self.ask_request()
-                ticker = self.api.getticker(symbol)
-            except Exception as e:
-                raise ExchangeRequestError(error=e)
+                summary = by_symbol[symbol]
+            except KeyError:
+                raise ExchangeRequestError(
+                    error='market summary not found for {}'.format(symbol)
+                )
 
-            # TODO: catch invalid ticker
             ticks[asset] = dict(
-                timestamp=pd.Timestamp.utcnow(),
-                bid=ticker['Bid'],
-                ask=ticker['Ask'],
-                last_price=ticker['Last']
+                timestamp=timestamp,
+                bid=summary['Bid'],
+                ask=summary['Ask'],
+                last_price=summary['Last']
             )
 
         log.debug('got tickers {}'.format(ticks))
@@ -320,14 +400,57 @@ class Bittrex(Exchange):
         log.info('retrieving account data')
         pass
 
-    def generate_symbols_json(self, filename=None):
+    def generate_symbols_json(self, filename=None, ttl=3600):
+        if filename is None:
+            filename = get_exchange_symbols_filename(self.name)
+
+        cache_filename = '{}.cache'.format(filename)
+
+        cache = dict()
+        if os.path.isfile(cache_filename):
+            try:
+                with open(cache_filename) as cache_file:
+                    cache = json.load(cache_file)
+            except ValueError:
+                pass
+
+        # The list of Bittrex markets rarely changes, skip the network
+        # round-trip entirely while the last refresh is recent enough.
+        if os.path.isfile(filename) and \
+                time.time() - cache.get('mtime', 0) < ttl:
+            log.debug('symbols are fresh, skipping refresh')
+            return
+
         symbol_map = {}
 
-        fn, r = download_exchange_symbols(self.name)
-        with open(fn) as data_file:
-            cached_symbols = json.load(data_file)
+        # Download to a sidecar path: the default download target is the
+        # same file this method generates, and it must only ever hold
+        # the generated map.
+        fn, r = download_exchange_symbols(
+            self.name, session=self._http,
+            filename='{}.remote'.format(filename)
+        )
+        with open(fn, 'rb') as data_file:
+            remote_bytes = data_file.read()
+        cached_symbols = fast_json_loads(remote_bytes)
 
         markets = self.api.getmarkets()
+
+        # The generated map depends on both the markets and the
+        # downloaded end dates, so the skip hash covers both.
+        source_hash = hashlib.sha256(
+            json.dumps(markets, sort_keys=True, default=str).encode('utf-8')
+            + remote_bytes
+        ).hexdigest()
+
+        if os.path.isfile(filename) and \
+                source_hash == cache.get('source_sha256'):
+            # Same inputs as last time, only the timestamp needs a bump.
+            with open(cache_filename, 'w') as cache_file:
+                json.dump(dict(mtime=time.time(),
+                               source_sha256=source_hash), cache_file)
+            return
+
         for market in markets:
             exchange_symbol = market['MarketName']
             symbol = '{market}_{base}'.format(
@@ -353,21 +476,19 @@ class Bittrex(Exchange):
                 end_minute=end_minute,
             )
 
-        if (filename is None):
-            filename = get_exchange_symbols_filename(self.name)
-
         with open(filename, 'w') as f:
             json.dump(symbol_map, f, sort_keys=True, indent=2,
                       separators=(',', ':'))
 
-    def get_orderbook(self, asset, order_type='all', limit=100):
-        if order_type == 'all':
-            order_type = 'both'
-        elif order_type == 'bid':
-            order_type = 'buy'
-        elif order_type == 'ask':
-            order_type = 'sell'
-        else:
+        with open(cache_filename, 'w') as cache_file:
+            json.dump(dict(mtime=time.time(),
+                           source_sha256=source_hash), cache_file)
+
+    def get_orderbook(self, asset, order_type='all', limit=100,
+                      as_dicts=False):
+        try:
+            order_type = ORDER_TYPE_MAP[order_type]
+        except KeyError:
             raise ValueError('invalid type')
 
         exchange_symbol = asset.exchange_symbol
@@ -384,11 +505,24 @@ class Bittrex(Exchange):
             elif exchange_type == 'sell':
                 order_type = 'asks'
 
-            result[order_type] = []
-            for entry in data[exchange_type]:
-                result[order_type].append(dict(
-                    rate=entry['Rate'],
-                    quantity=entry['Quantity']
-                ))
+            entries = data[exchange_type]
+            if as_dicts:
+                result[order_type] = [
+                    dict(rate=entry['Rate'], quantity=entry['Quantity'])
+                    for entry in entries
+                ]
+            else:
+                # Two contiguous arrays per side instead of one dict
+                # per entry, ready for vectorized math downstream.
+                result[order_type] = dict(
+                    rate=np.fromiter(
+                        (entry['Rate'] for entry in entries),
+                        dtype=np.float64, count=len(entries)
+                    ),
+                    quantity=np.fromiter(
+                        (entry['Quantity'] for entry in entries),
+                        dtype=np.float64, count=len(entries)
+                    )
+                )
 
         return result
@@ -5,13 +5,13 @@ from datetime import timedelta, datetime, date
 
 import numpy as np
 import pandas as pd
-import pytz
+import requests
 
 from catalyst.data.bundles import from_bundle_ingest_dirname
-from catalyst.data.bundles.core import download_without_progress
 from catalyst.exchange.exchange_errors import NoDataAvailableOnExchange
 from catalyst.exchange.exchange_utils import get_exchange_bundles_folder
 from catalyst.utils.deprecate import deprecated
+from catalyst.utils.memoize import weak_lru_cache
 from catalyst.utils.paths import data_path
 
 EXCHANGE_NAMES = ['bitfinex', 'bittrex', 'poloniex']
@@ -19,14 +19,15 @@ API_URL = 'http://data.enigma.co/api/v1'
 
 
 def get_date_from_ms(ms):
-    return datetime.fromtimestamp(ms / 1000.0)
+    ms = int(ms)
+    return datetime.fromtimestamp(ms // 1000) + \
+        timedelta(milliseconds=ms % 1000)
 
 
 def get_seconds_from_date(date):
-    epoch = datetime.utcfromtimestamp(0)
-    epoch = epoch.replace(tzinfo=pytz.UTC)
-
-    return int((date - epoch).total_seconds())
+    # calendar.timegm is pure integer math, no epoch datetime or
+    # timedelta needs to be built on each call.
+    return calendar.timegm(date.utctimetuple())
 
 
 def get_bcolz_chunk(exchange_name, symbol, data_frequency, period):
@@ -59,9 +60,16 @@ def get_bcolz_chunk(exchange_name, symbol, data_frequency, period):
             name=name
         )
 
-        bytes = download_without_progress(url)
-        with tarfile.open('r', fileobj=bytes) as tar:
-            tar.extractall(path)
+        # Piping the response directly into the extractor overlaps the
+        # download with the extraction and keeps the archive out of
+        # memory, instead of buffering the whole tarball first.
+        response = requests.get(url, stream=True, timeout=60)
+        try:
+            response.raise_for_status()
+            with tarfile.open(mode='r|gz', fileobj=response.raw) as tar:
+                tar.extractall(path)
+        finally:
+            response.close()
 
     return path
 
@@ -71,12 +79,16 @@ def get_delta(periods, data_frequency):
         if data_frequency == 'minute' else timedelta(days=periods)
 
 
+@weak_lru_cache(maxsize=256)
 def get_periods_range(start_dt, end_dt, data_frequency):
+    # The same (start, end, frequency) triples come back over and over
+    # during ingest, and a year of minutes is a ~525k entry index.
     freq = 'T' if data_frequency == 'minute' else 'D'
 
     return pd.date_range(start_dt, end_dt, freq=freq)
 
 
+@weak_lru_cache(maxsize=256)
 def get_periods(start_dt, end_dt, data_frequency):
     delta = end_dt - start_dt
 
@@ -113,17 +125,19 @@ def get_adj_dates(start, end, assets, data_frequency):
     :param data_frequency:
     :return:
     """
-    earliest_trade = None
-    last_entry = None
-    for asset in assets:
-        if earliest_trade is None or earliest_trade > asset.start_date:
-            earliest_trade = asset.start_date
-
-        end_asset = asset.end_minute if data_frequency == 'minute' else \
-            asset.end_daily
-        if end_asset is not None and \
-                (last_entry is None or end_asset > last_entry):
-            last_entry = end_asset
+    # Reducing over int64 arrays replaces a Python comparison per asset.
+    starts = np.array(
+        [asset.start_date.value for asset in assets], dtype='i8'
+    )
+    earliest_trade = pd.Timestamp(starts.min(), tz='UTC')
+
+    end_attr = 'end_minute' if data_frequency == 'minute' else 'end_daily'
+    ends = np.array(
+        [getattr(asset, end_attr).value for asset in assets
+         if getattr(asset, end_attr) is not None],
+        dtype='i8'
+    )
+    last_entry = pd.Timestamp(ends.max(), tz='UTC') if ends.size else None
 
     if start is None or earliest_trade > start:
         start = earliest_trade
@@ -133,14 +147,28 @@ def get_adj_dates(start, end, assets, data_frequency):
 
     if end is None or start >= end:
         raise NoDataAvailableOnExchange(
-            exchange=asset.exchange.title(),
-            symbol=[asset.symbol.encode('utf-8')],
+            exchange=assets[0].exchange.title(),
+            symbol=[asset.symbol.encode('utf-8') for asset in assets],
             data_frequency=data_frequency,
         )
 
     return start, end
 
 
+@weak_lru_cache(maxsize=64)
+def _get_month_start_end(year, month):
+    month_range = calendar.monthrange(year, month)
+    month_start = pd.to_datetime(datetime(
+        year, month, 1, 0, 0, 0, 0
+    ), utc=True)
+
+    month_end = pd.to_datetime(datetime(
+        year, month, month_range[1], 23, 59, 0, 0
+    ), utc=True)
+
+    return month_start, month_end
+
+
 def get_month_start_end(dt):
     """
     Returns the first and last day of the month for the specified date.
@@ -148,16 +176,15 @@ def get_month_start_end(dt):
     :param dt:
     :return:
     """
-    month_range = calendar.monthrange(dt.year, dt.month)
-    month_start = pd.to_datetime(datetime(
-        dt.year, dt.month, 1, 0, 0, 0, 0
-    ), utc=True)
+    return _get_month_start_end(dt.year, dt.month)
 
-    month_end = pd.to_datetime(datetime(
-        dt.year, dt.month, month_range[1], 23, 59, 0, 0
-    ), utc=True)
 
-    return month_start, month_end
+@weak_lru_cache(maxsize=64)
+def _get_year_start_end(year):
+    year_start = pd.to_datetime(date(year, 1, 1), utc=True)
+    year_end = pd.to_datetime(date(year, 12, 31), utc=True)
+
+    return year_start, year_end
 
 
 def get_year_start_end(dt):
@@ -167,17 +194,15 @@ def get_year_start_end(dt):
     :param dt:
     :return:
     """
-    year_start = pd.to_datetime(date(dt.year, 1, 1), utc=True)
-    year_end = pd.to_datetime(date(dt.year, 12, 31), utc=True)
-
-    return year_start, year_end
+    return _get_year_start_end(dt.year)
 
 
 def get_df_from_arrays(arrays, periods):
     ohlcv = dict()
     for index, field in enumerate(
             ['open', 'high', 'low', 'close', 'volume']):
-        ohlcv[field] = arrays[index].flatten()
+        # ravel returns a view where flatten always copies.
+        ohlcv[field] = arrays[index].ravel()
 
     df = pd.DataFrame(
         data=ohlcv,
@@ -197,30 +222,61 @@ def range_in_bundle(asset, start_dt, end_dt, reader):
     :param reader:
     :return:
     """
-    has_data = True
-    if has_data and reader is not None:
-        try:
-            start_close = \
-                reader.get_value(asset.sid, start_dt, 'close')
-
-            if np.isnan(start_close):
-                has_data = False
+    if reader is None:
+        return False
+
+    # Misses are remembered per reader so repeat queries for a range
+    # known to have no data skip the read (and the raised-and-caught
+    # exception) entirely. Ingesting creates a fresh reader, which
+    # naturally drops the cache.
+    misses = getattr(reader, '_range_misses', None)
+    if misses is None:
+        misses = set()
+        reader._range_misses = misses
+
+    key = (asset.sid, start_dt.value, end_dt.value)
+    if key in misses:
+        return False
 
-            else:
-                end_close = reader.get_value(asset.sid, end_dt, 'close')
+    try:
+        # A single contiguous read of the close column instead of two
+        # random seeks into the bcolz data.
+        arrays = reader.load_raw_arrays(
+            ['close'], start_dt, end_dt, [asset.sid]
+        )
+    except Exception as e:
+        misses.add(key)
+        return False
 
-                if np.isnan(end_close):
-                    has_data = False
+    closes = arrays[0][:, 0]
 
-        except Exception as e:
-            has_data = False
+    has_data = closes.size > 0 and \
+        not np.isnan(closes[0]) and not np.isnan(closes[-1])
 
-    else:
-        has_data = False
+    if not has_data:
+        misses.add(key)
 
     return has_data
 
 
+def range_in_bundle_many(assets, start_dt, end_dt, reader):
+    """
+    Evaluate range_in_bundle for multiple assets sharing a date range.
+
+    Each asset gets its own contiguous read: the reader computes its
+    zero-mask from the first sid only, so a multi-sid read reports the
+    first asset's coverage for all of them.
+
+    :param assets:
+    :param start_dt:
+    :param end_dt:
+    :param reader:
+    :return: list[bool]
+    """
+    return [range_in_bundle(asset, start_dt, end_dt, reader)
+            for asset in assets]
+
+
 @deprecated
 def find_most_recent_time(bundle_name):
     """
@@ -239,16 +295,7 @@ def find_most_recent_time(bundle_name):
     except OSError:
         return None
 
-    most_recent_bundle = dict()
-    for folder in bundle_folders:
-        date = from_bundle_ingest_dirname(folder)
-        if not most_recent_bundle or date > \
-                most_recent_bundle[most_recent_bundle.keys()[0]]:
-            most_recent_bundle = dict()
-            most_recent_bundle[folder] = date
-
-    if most_recent_bundle:
-        return most_recent_bundle.keys()[0]
-    else:
+    if not bundle_folders:
         return None
 
+    return max(bundle_folders, key=from_bundle_ingest_dirname)
@@ -1,8 +1,7 @@
 import abc
 import re
+import threading
 from abc import ABCMeta, abstractmethod, abstractproperty
-from datetime import timedelta
-from time import sleep
 
 import numpy as np
 import pandas as pd
@@ -20,7 +19,8 @@ from catalyst.exchange.exchange_errors import MismatchingBaseCurrencies, \
 from catalyst.exchange.exchange_execution import ExchangeStopLimitOrder, \
     ExchangeLimitOrder, ExchangeStopOrder
 from catalyst.exchange.exchange_portfolio import ExchangePortfolio
-from catalyst.exchange.exchange_utils import get_exchange_symbols
+from catalyst.exchange.exchange_utils import get_exchange_symbols, \
+    TokenBucket
 from catalyst.finance.order import ORDER_STATUS
 from catalyst.finance.transaction import Transaction
 
@@ -32,9 +32,16 @@ log = Logger('Exchange', level=LOG_LEVEL)
 class Exchange:
     __metaclass__ = ABCMeta
 
+    # Lazily populated through the assets property. The lock lives on
+    # the class because the concrete exchanges do not call
+    # Exchange.__init__; it is reentrant since the symbol cache build
+    # can itself trigger the lazy load.
+    _assets = None
+    _assets_lock = threading.RLock()
+
     def __init__(self):
         self.name = None
-        self.assets = {}
+        self._assets = None
         self._portfolio = None
         self.minute_writer = None
         self.minute_reader = None
@@ -42,7 +49,7 @@ class Exchange:
 
         self.num_candles_limit = None
         self.max_requests_per_minute = None
-        self.request_cpt = None
+        self._rate_limit_bucket = None
         self.bundle = ExchangeBundle(self)
 
     @property
@@ -64,6 +71,25 @@ class Exchange:
 
         return self._portfolio
 
+    @property
+    def assets(self):
+        """
+        The trading pairs supported by the exchange, loaded from the
+        symbol map on first access. Deferring the load keeps
+        construction free of the disk read and JSON parse for callers
+        that never touch the asset list.
+        """
+        if self._assets is None:
+            with self._assets_lock:
+                if self._assets is None:
+                    self.load_assets()
+
+        return self._assets
+
+    @assets.setter
+    def assets(self, value):
+        self._assets = value
+
     @abstractproperty
     def account(self):
         pass
@@ -77,38 +103,23 @@ class Exchange:
         Asks permission to issue a request to the exchange.
         The primary purpose is to avoid hitting rate limits.
 
-        The application will pause if the maximum requests per minute
-        permitted by the exchange is exceeded.
+        Requests draw tokens from a bucket refilled at the rate permitted
+        by the exchange, so the application only pauses when the bucket
+        runs empty. Concurrent callers may proceed while tokens remain.
 
         :return boolean:
 
         """
-        now = pd.Timestamp.utcnow()
-        if not self.request_cpt:
-            self.request_cpt = dict()
-            self.request_cpt[now] = 0
-            return True
-
-        cpt_date = self.request_cpt.keys()[0]
-        cpt = self.request_cpt[cpt_date]
-
-        if now > cpt_date + timedelta(minutes=1):
-            self.request_cpt = dict()
-            self.request_cpt[now] = 0
-            return True
-
-        if cpt >= self.max_requests_per_minute:
-            delta = now - cpt_date
+        # The concrete exchanges do not call Exchange.__init__, so the
+        # bucket attribute may not exist yet on first use.
+        if getattr(self, '_rate_limit_bucket', None) is None:
+            self._rate_limit_bucket = TokenBucket(
+                rate=self.max_requests_per_minute / 60.0,
+                capacity=self.max_requests_per_minute
+            )
 
-            sleep_period = 60 - delta.total_seconds()
-            sleep(sleep_period)
-
-            now = pd.Timestamp.utcnow()
-            self.request_cpt = dict()
-            self.request_cpt[now] = 0
-            return True
-        else:
-            self.request_cpt[cpt_date] += 1
+        self._rate_limit_bucket.consume(1)
+        return True
 
     def get_symbol(self, asset):
         """
@@ -117,18 +128,27 @@ class Exchange:
         :param asset: Asset
         :return: symbol: str
         """
-        symbol = None
+        symbol_map = getattr(self, '_exchange_symbol_cache', None)
+        if symbol_map is None:
+            # The asset list is fixed for the lifetime of the exchange,
+            # build the reverse map once instead of scanning the assets
+            # dict on every lookup. The lock keeps concurrent callers
+            # from caching a map built from a partial load.
+            with self._assets_lock:
+                symbol_map = getattr(self, '_exchange_symbol_cache', None)
+                if symbol_map is None:
+                    symbol_map = dict()
+                    for key in self.assets:
+                        symbol_map.setdefault(self.assets[key].symbol, key)
+
+                    self._exchange_symbol_cache = symbol_map
 
-        for key in self.assets:
-            if not symbol and self.assets[key].symbol == asset.symbol:
-                symbol = key
-
-        if not symbol:
+        try:
+            return symbol_map[asset.symbol]
+        except KeyError:
             raise ValueError('Currency %s not supported by exchange %s' %
                              (asset['symbol'], self.name.title()))
 
-        return symbol
-
     def get_symbols(self, assets):
         """
         Get a list of symbols corresponding to each given asset.
@@ -199,6 +219,7 @@ class Exchange:
         This method can be overridden if an exchange offers equivalent data
         via its api.
         """
+        assets = dict()
 
         symbol_map = self.fetch_symbol_map()
         for exchange_symbol in symbol_map:
@@ -252,7 +273,12 @@ class Exchange:
                 exchange_symbol=exchange_symbol
             )
 
-            self.assets[exchange_symbol] = trading_pair
+            assets[exchange_symbol] = trading_pair
+
+        # Publish fully populated so a concurrent reader never observes
+        # a partially filled dict.
+        self._assets = assets
+        self._exchange_symbol_cache = None
 
     def check_open_orders(self):
         """
@@ -9,8 +9,9 @@ from catalyst import get_calendar
 from catalyst.data.minute_bars import BcolzMinuteOverlappingData, \
     BcolzMinuteBarMetadata
 from catalyst.exchange.bundle_utils import range_in_bundle, \
-    get_bcolz_chunk, get_delta, get_adj_dates, get_month_start_end, \
-    get_year_start_end, get_periods_range, get_df_from_arrays, get_start_dt
+    range_in_bundle_many, get_bcolz_chunk, get_delta, get_adj_dates, \
+    get_month_start_end, get_year_start_end, get_periods_range, \
+    get_df_from_arrays, get_start_dt
 from catalyst.exchange.exchange_bcolz import BcolzExchangeBarReader, \
     BcolzExchangeBarWriter
 from catalyst.exchange.exchange_errors import EmptyValuesInBundleError, \
@@ -148,10 +149,10 @@ class ExchangeBundle:
             The assets missing from the bundle
         """
         reader = self.get_reader(data_frequency)
-        missing_assets = []
-        for asset in assets:
-            has_data = range_in_bundle(asset, start_dt, end_dt, reader)
+        has_data_list = range_in_bundle_many(assets, start_dt, end_dt, reader)
 
+        missing_assets = []
+        for asset, has_data in zip(assets, has_data_list):
             if not has_data:
                 missing_assets.append(asset)
 
@@ -191,6 +192,12 @@ class ExchangeBundle:
                 invalid_data_behavior='raise'
             )
 
+        # The write may have filled ranges that range_in_bundle has
+        # already recorded as missing on the cached readers.
+        for reader in self._readers.values():
+            if reader is not None and hasattr(reader, '_range_misses'):
+                reader._range_misses.clear()
+
     def get_calendar_periods_range(self, start_dt, end_dt, data_frequency):
         return self.calendar.minutes_in_range(start_dt, end_dt) \
             if data_frequency == 'minute' \
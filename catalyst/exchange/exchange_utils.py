@@ -1,6 +1,8 @@
 import json
 import os
 import pickle
+import threading
+import time
 import urllib
 from datetime import date, datetime
 
@@ -10,10 +12,88 @@ from catalyst.exchange.exchange_errors import ExchangeAuthNotFound, \
     ExchangeSymbolsNotFound
 from catalyst.utils.paths import data_root, ensure_directory, last_modified_time
 
+# Optional fast JSON parsers, used on the hot read paths.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
 SYMBOLS_URL = 'https://s3.amazonaws.com/enigmaco/catalyst-exchanges/' \
               '{exchange}/symbols.json'
 
 
+def fast_json_loads(data):
+    """
+    Parse JSON with the fastest parser available, falling back to the
+    stdlib when neither orjson nor ujson is installed.
+
+    :param data: str or bytes
+    :return:
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+
+    if ujson is not None:
+        return ujson.loads(data)
+
+    if isinstance(data, bytes):
+        data = data.decode('utf-8')
+
+    return json.loads(data)
+
+
+class TokenBucket(object):
+    """
+    Thread-safe token bucket used to throttle outgoing exchange requests.
+
+    Tokens refill continuously at the given rate up to capacity, so
+    callers can burst up to `capacity` requests and only pause when the
+    bucket is empty, instead of being serialized on per-call bookkeeping.
+
+    :param rate: refill rate, in tokens per second
+    :param capacity: maximum number of tokens held by the bucket
+    """
+
+    def __init__(self, rate, capacity):
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self._tokens = float(capacity)
+        self._last_refill = time.time()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.time()
+        elapsed = now - self._last_refill
+        if elapsed > 0:
+            self._tokens = min(
+                self.capacity, self._tokens + elapsed * self.rate
+            )
+            self._last_refill = now
+
+    def consume(self, tokens=1):
+        """
+        Take the requested number of tokens from the bucket, sleeping
+        only for the time needed to refill when not enough are left.
+
+        :param tokens:
+        :return:
+        """
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait = (tokens - self._tokens) / self.rate
+
+            time.sleep(wait)
+
+
 def get_exchange_folder(exchange_name, environ=None):
     if not environ:
         environ = os.environ
@@ -30,9 +110,19 @@ def get_exchange_symbols_filename(exchange_name, environ=None):
     return os.path.join(exchange_folder, 'symbols.json')
 
 
-def download_exchange_symbols(exchange_name, environ=None):
-    filename = get_exchange_symbols_filename(exchange_name)
+def download_exchange_symbols(exchange_name, environ=None, session=None,
+                              filename=None):
+    if filename is None:
+        filename = get_exchange_symbols_filename(exchange_name)
     url = SYMBOLS_URL.format(exchange=exchange_name)
+
+    if session is not None:
+        response = session.get(url, timeout=10)
+        response.raise_for_status()
+        with open(filename, 'wb') as f:
+            f.write(response.content)
+        return filename, response
+
     response = urllib.urlretrieve(url=url, filename=filename)
     return response
 
@@ -45,8 +135,8 @@ def get_exchange_symbols(exchange_name, environ=None):
         download_exchange_symbols(exchange_name, environ)
 
     if os.path.isfile(filename):
-        with open(filename) as data_file:
-            data = json.load(data_file)
+        with open(filename, 'rb') as data_file:
+            data = fast_json_loads(data_file.read())
             return data
     else:
         raise ExchangeSymbolsNotFound(
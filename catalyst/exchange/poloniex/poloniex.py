@@ -42,8 +42,6 @@ class Poloniex(Exchange):
     def __init__(self, key, secret, base_currency, portfolio=None):
         self.api = Poloniex_api(key=key, secret=secret.encode('UTF-8'))
         self.name = 'poloniex'
-        self.assets = {}
-        self.load_assets()
         self.base_currency = base_currency
         self._portfolio = portfolio
         self.minute_writer = None
@@ -52,7 +50,6 @@ class Poloniex(Exchange):
 
         self.num_candles_limit = 2000
         self.max_requests_per_minute = 60
-        self.request_cpt = dict()
 
         self.bundle = ExchangeBundle(self)
 
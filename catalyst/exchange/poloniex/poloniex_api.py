@@ -6,6 +6,8 @@ import hashlib
 
 from six.moves import urllib
 
+from catalyst.exchange.exchange_utils import TokenBucket
+
 # Workaround for backwards compatibility
 # https://stackoverflow.com/questions/3745771/urllib-request-in-python-2-7
 urlopen = urllib.request.urlopen
@@ -17,7 +19,10 @@ class Poloniex_api(object):
         self.secret = secret
 
         self.max_requests_per_second = 6
-        self.request_cpt = dict()
+        self._rate_limit_bucket = TokenBucket(
+            rate=self.max_requests_per_second,
+            capacity=self.max_requests_per_second
+        )
 
         self.public  = ['returnTicker', 'return24Volume', 'returnOrderBook',
                         'returnTradeHistory', 'returnChartData',
@@ -38,37 +43,14 @@ class Poloniex_api(object):
         Asks permission to issue a request to the exchange.
         The primary purpose is to avoid hitting rate limits.
 
-        The application will pause if the maximum requests per minute
-        permitted by the exchange is exceeded.
+        Requests draw tokens from a bucket refilled at the rate permitted
+        by the exchange, pausing only when the bucket runs empty.
 
         :return boolean:
 
         """
-        now = time.time()
-        if not self.request_cpt:
-            self.request_cpt = dict()
-            self.request_cpt[now] = 0
-            return True
-
-        cpt_date = self.request_cpt.keys()[0]
-        cpt = self.request_cpt[cpt_date]
-
-        if now > cpt_date + 1:
-            self.request_cpt = dict()
-            self.request_cpt[now] = 0
-            return True
-
-        if cpt >= self.max_requests_per_second:
-            
-            log.debug('max requests 6 reached, sleeping for 1 seconds')
-            sleep(1)
-
-            now = time.time()
-            self.request_cpt = dict()
-            self.request_cpt[now] = 0
-            return True
-        else:
-            self.request_cpt[cpt_date] += 1
+        self._rate_limit_bucket.consume(1)
+        return True
 
     def query(self, method, req={}):
 
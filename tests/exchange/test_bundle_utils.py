@@ -0,0 +1,63 @@
+from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+
+from catalyst.exchange.bundle_utils import range_in_bundle, \
+    range_in_bundle_many
+
+
+class StubAsset(object):
+    def __init__(self, sid):
+        self.sid = sid
+
+
+class StubReader(object):
+    """
+    Minimal reader serving a fixed close column per sid. Assets without
+    a column raise, like a sid missing from the bundle.
+    """
+
+    def __init__(self, closes_by_sid):
+        self.closes_by_sid = closes_by_sid
+
+    def load_raw_arrays(self, fields, start_dt, end_dt, sids):
+        columns = []
+        for sid in sids:
+            if sid not in self.closes_by_sid:
+                raise KeyError(sid)
+            columns.append(self.closes_by_sid[sid])
+
+        return [np.column_stack(columns)]
+
+
+class TestBundleUtils(TestCase):
+    start_dt = pd.Timestamp('2017-10-01', tz='UTC')
+    end_dt = pd.Timestamp('2017-10-02', tz='UTC')
+
+    def test_range_in_bundle(self):
+        reader = StubReader({
+            1: np.array([1.0, 2.0, 3.0]),
+            2: np.array([np.nan, 2.0, 3.0]),
+        })
+        self.assertTrue(range_in_bundle(
+            StubAsset(1), self.start_dt, self.end_dt, reader))
+        self.assertFalse(range_in_bundle(
+            StubAsset(2), self.start_dt, self.end_dt, reader))
+        self.assertFalse(range_in_bundle(
+            StubAsset(3), self.start_dt, self.end_dt, reader))
+
+    def test_range_in_bundle_many_mixed_coverage(self):
+        # Assets with different coverage must be evaluated per sid,
+        # not from the first asset's coverage mask.
+        reader = StubReader({
+            1: np.array([1.0, 2.0, 3.0]),
+            2: np.array([np.nan, 2.0, 3.0]),
+            3: np.array([1.0, 2.0, np.nan]),
+        })
+        assets = [StubAsset(1), StubAsset(2), StubAsset(3), StubAsset(4)]
+
+        has_data = range_in_bundle_many(
+            assets, self.start_dt, self.end_dt, reader
+        )
+        self.assertEqual(has_data, [True, False, False, False])